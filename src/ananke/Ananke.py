@@ -33,8 +33,8 @@ class Ananke:
     # _elem_list = Galaxia.Input._elem_list  # other abundances in the list as [X/H]
     # _par_id = Galaxia.Input._parentid  # indices of parent particles in snapshot
     # _dform = Galaxia.Input._dform  # formation distance
-    _rho_pos = DensitiesDriver._density_template(POS_TAG)
-    _rho_vel = DensitiesDriver._density_template(VEL_TAG)
+    _rho_pos = DensitiesDriver._density_keys[POS_TAG]
+    _rho_vel = DensitiesDriver._density_keys[VEL_TAG]
     _log10NH = ExtinctionDriver._col_density
     _required_particles_keys = Galaxia.Input._required_keys_in_particles
     _optional_particles_keys = Galaxia.Input._optional_keys_in_particles
@@ -237,9 +237,11 @@ class Ananke:
     
     def _postprocess_observed_mags(self, galaxia_output: Galaxia.Output):
         mag_names = self.galaxia_catalogue_mag_names
-        for mag in mag_names:
-            galaxia_output[self._intrinsic_mag_template(mag)] = galaxia_output[mag]
-            galaxia_output[mag] += galaxia_output[galaxia_output._dmod]
+        intrinsic_mag_names = tuple(map(self._intrinsic_mag_template, mag_names))
+        dmod = galaxia_output[galaxia_output._dmod]
+        for mag, intrinsic_mag in zip(mag_names, intrinsic_mag_names):
+            galaxia_output[intrinsic_mag] = galaxia_output[mag]
+            galaxia_output[mag] += dmod
         galaxia_output.flush_extra_columns_to_hdf5(with_columns=mag_names)
 
     def run(self, **kwargs):
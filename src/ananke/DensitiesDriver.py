@@ -8,7 +8,9 @@ available in the main ``ananke`` namespace - use that instead.
 from __future__ import annotations
 from typing import TYPE_CHECKING
 import pathlib
-import EnBiD_ananke as EnBiD
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 
 from . import utils
 from .constants import *
@@ -25,6 +27,11 @@ class DensitiesDriver:
     """
     _density_formatter = 'rho_{}'
     _density_template = _density_formatter.format
+    _density_keys = {POS_TAG: _density_template(POS_TAG), VEL_TAG: _density_template(VEL_TAG)}
+    _estimators = ('enbid', 'kdtree')
+    _default_estimator = 'enbid'
+    _density_dtype = np.float32  # precision of the kernel density estimates
+
     def __init__(self, ananke: Ananke, **kwargs) -> None:
         """
             Parameters
@@ -32,6 +39,12 @@ class DensitiesDriver:
             ananke : Ananke object
                 The Ananke object that utilizes this DensitiesDriver object
             
+            estimator : str
+                Density estimator to use, either 'enbid' to run EnBiD, or
+                'kdtree' for a k-nearest neighbour estimate computed in memory
+                with a KD-tree, which avoids the EnBiD subprocess and its file
+                I/O at the cost of a cruder estimate. Default to '{ESTIMATOR}'
+
             **kwargs
                 Additional parameters to be used by the density estimator. In
                 the current implementation, these include all the configurable
@@ -40,8 +53,11 @@ class DensitiesDriver:
         """
         self.__ananke = ananke
         self.__parameters = kwargs
+        self.__particle_densities = None
         self.densities = self.particle_densities
     
+    __init__.__doc__ = __init__.__doc__.format(ESTIMATOR=_default_estimator)
+
     def _run_enbid(self):
         """
             Method to generate the dictionary of kernel density estimates with EnBiD
@@ -53,14 +69,52 @@ class DensitiesDriver:
                 A dictionary of same-length arrays representing kernel density
                 estimates for the pipeline particles
         """
+        # EnBiD is only imported when densities actually need to be estimated with it
+        import EnBiD_ananke as EnBiD
         path = pathlib.Path(self.name)
-        rho_pos = EnBiD.enbid(self.particle_positions, name=path / POS_TAG, ngb=self.ngb, **self.parameters)
-        rho_vel = EnBiD.enbid(self.particle_velocities, name=path / VEL_TAG, ngb=self.ngb, **self.parameters)
-        self.densities = {POS_TAG: rho_pos, VEL_TAG: rho_vel}
-        return self.densities
+        # both estimates are independent and run in their own EnBiD working directory
+        return self._run_concurrently(partial(EnBiD.enbid, self.particle_positions, name=path / POS_TAG, ngb=self.ngb, **self.enbid_parameters),
+                                      partial(EnBiD.enbid, self.particle_velocities, name=path / VEL_TAG, ngb=self.ngb, **self.enbid_parameters))
     
     _run_enbid.__doc__ = _run_enbid.__doc__.format(POS_TAG=POS_TAG, VEL_TAG=VEL_TAG)
 
+    @staticmethod
+    def _kdtree_density(points, ngb):
+        import scipy as sp
+        import scipy.spatial
+        # the nearest neighbour of each particle is itself, hence ngb+1
+        r_ngb = sp.spatial.cKDTree(points).query(points, k=[ngb+1], workers=-1)[0][:,0]
+        if not r_ngb.all():
+            raise ValueError(f"Some particles share their coordinates with at least {ngb} others, their k-nearest neighbour density is undefined: remove the duplicates or use the 'enbid' estimator")
+        # number of particles per unit volume in the 3-dimensional ball reaching the ngb-th neighbour, as EnBiD estimates
+        return ngb / (4/3*np.pi*r_ngb**3)
+
+    def _run_kdtree(self):
+        """
+            Method to generate the dictionary of k-nearest neighbour density
+            estimates with a KD-tree that is needed to generate the survey from
+            the pipeline particles
+            
+            Returns
+            ----------
+            rho : dict({POS_TAG}=array_like, {VEL_TAG}=array_like)
+                A dictionary of same-length arrays representing k-nearest
+                neighbour density estimates for the pipeline particles
+        """
+        # cKDTree releases the GIL while querying
+        return self._run_concurrently(partial(self._kdtree_density, self.particle_positions, self.ngb),
+                                      partial(self._kdtree_density, self.particle_velocities, self.ngb))
+    
+    _run_kdtree.__doc__ = _run_kdtree.__doc__.format(POS_TAG=POS_TAG, VEL_TAG=VEL_TAG)
+
+    def _run_concurrently(self, estimate_pos, estimate_vel):
+        # run both independent density estimates concurrently and store them at the densities precision
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rho_pos, rho_vel = executor.submit(estimate_pos), executor.submit(estimate_vel)
+            self.densities = {POS_TAG: np.asarray(rho_pos.result(), dtype=self._density_dtype),
+                              VEL_TAG: np.asarray(rho_vel.result(), dtype=self._density_dtype)}
+        return self.densities
+
     def _check_densities_format(self, densities):
         if densities is not None:
             if isinstance(densities, dict):
@@ -83,9 +137,12 @@ class DensitiesDriver:
 
     @property
     def particle_densities(self):
-        return {key: self.ananke.particles[self._density_template(key)]
-                for key in [POS_TAG, VEL_TAG]
-                if self._density_template(key) in self.ananke.particles}
+        if self.__particle_densities is None:
+            particles = self.ananke.particles
+            self.__particle_densities = {key: particles[density_key]
+                                         for key, density_key in self._density_keys.items()
+                                         if density_key in particles}
+        return self.__particle_densities
     
     @property
     def name(self):
@@ -99,12 +156,23 @@ class DensitiesDriver:
     def parameters(self):
         return self.__parameters
     
+    @property
+    def enbid_parameters(self):
+        return {key: value for key, value in self.parameters.items() if key != 'estimator'}
+
+    @property
+    def estimator(self):
+        estimator = self.parameters.get('estimator', self._default_estimator)
+        if estimator not in self._estimators:
+            raise ValueError(f"Density estimator should be one of {list(self._estimators)}, got '{estimator}'")
+        return estimator
+    
     @property
     def densities(self):
         if self.__densities:
             return self.__densities
         else:
-            return self._run_enbid()
+            return getattr(self, f"_run_{self.estimator}")()
     
     @densities.setter
     def densities(self, densities):
@@ -116,4 +184,5 @@ class DensitiesDriver:
         """
             Print the EnBiD.run_enbid docstring
         """
+        import EnBiD_ananke as EnBiD
         print(EnBiD.run_enbid.__doc__)
@@ -30,6 +30,8 @@ class ErrorModelDriver:
     _error_formatter = '{}_Err'
     _error_template = _error_formatter.format
     _extra_output_keys = ()
+    _error_dtype = np.float32  # precision of the standard error and drawn error columns
+    _draw_chunk_size = 2**20  # number of gaussian errors drawn at once
 
     def __init__(self, ananke: Ananke, **kwargs) -> None:
         """
@@ -48,13 +50,27 @@ class ErrorModelDriver:
                 By default, the class will query the chosen photometric system
                 to check if it has a default model to use. If it doesn't find one
                 it will simply fill errors with nan values.
+
+            seed : int or numpy.random.SeedSequence
+                Seed used to initialize the random number generator from which
+                the gaussian drawn errors are sampled. Default to None, which
+                draws fresh entropy from the operating system.
+
+            ignore : bool
+                If True, the error model is not applied and the catalogue is
+                left without drawn errors. Default to False.
         """
         self.__ananke = ananke
+        self.__ananke_particle_attributes = frozenset(attr for attr in dir(ananke) if attr.startswith('particle'))
         self.__parameters = kwargs
+        self.__rng = np.random.default_rng(self.seed)
+        self.__sigma_keys = None
+        self.__error_keys = None
+        self.__first_error_key = None
         self._test_error_model()
     
     def __getattr__(self, item):
-        if (item in self.ananke.__dir__() and item.startswith('particle')):
+        if item in self.__ananke_particle_attributes:
             return getattr(self.ananke, item)
         else:
             return self.__getattribute__(item)
@@ -71,48 +87,100 @@ class ErrorModelDriver:
         error_model = self.error_model
         if not isinstance(error_model, Iterable):
             error_model = [error_model]
-        return {key: error for error_dict in [(err_model(df) if callable(err_model) else err_model) for err_model in error_model] for key,error in error_dict.items()}  # TODO adapt to dataframe type of output?
+        errors = {}
+        for err_model in error_model:
+            errors.update(err_model(df) if callable(err_model) else err_model)  # TODO adapt to dataframe type of output?
+        return errors
 
     def _test_error_model(self):
-        dummy_df = utils.RecordingDataFrame([], columns = self.ananke.galaxia_catalogue_keys + self._extra_output_keys)  # TODO make use of dummy_df.record_of_all_used_keys
-        dummy_df.loc[0] = np.nan
+        columns = self.ananke.galaxia_catalogue_keys + self._extra_output_keys
+        dummy_df = utils.RecordingDataFrame(np.full((1, len(columns)), np.nan), columns=columns)  # TODO make use of dummy_df.record_of_all_used_keys
         try:
             dummy_err = self._expand_and_apply_error_model(dummy_df)
         except KeyError as KE:
             raise KE  # TODO make it more informative
         utils.compare_given_and_required(dummy_err.keys(), set(), self.ananke.galaxia_catalogue_mag_and_astrometrics, error_message="Given error model function returns wrong set of keys")
+        self.__error_prop_names = tuple(dummy_err.keys())
+
+    @property
+    def _error_prop_names(self):
+        return self.__error_prop_names
     
     @property
     def _sigma_keys(self):
-        return set(map(self._sigma_template, self.ananke.galaxia_catalogue_mag_names))
+        if self.__sigma_keys is None:
+            self.__sigma_keys = frozenset(map(self._sigma_template, self.ananke.galaxia_catalogue_mag_names))
+        return self.__sigma_keys
 
     @property
     def _error_keys(self):
-        return set(map(self._error_template, self.ananke.galaxia_catalogue_mag_names))
+        if self.__error_keys is None:
+            self.__error_keys = frozenset(map(self._error_template, self.ananke.galaxia_catalogue_mag_names))
+        return self.__error_keys
+
+    @property
+    def _first_error_key(self):
+        # error columns are all added in the same pass, checking the first one the error model produces is enough to tell if they were added
+        if self.__first_error_key is None:
+            self.__first_error_key = self._error_template(self._error_prop_names[0])
+        return self.__first_error_key
+
+    def _draw_gaussian_errors(self, sigma, n_stars):
+        """
+            Draw n_stars gaussian errors of standard deviations sigma, filling
+            the output chunk by chunk so that the standard normal draws only
+            ever occupy a buffer of _draw_chunk_size elements. The sequence
+            of draws does not depend on the chunk size.
+        """
+        drawn = np.empty(n_stars, dtype=self._error_dtype)
+        noise = np.empty(min(self._draw_chunk_size, n_stars), dtype=self._error_dtype)
+        for start in range(0, n_stars, max(noise.shape[0], 1)):
+            stop = min(start + noise.shape[0], n_stars)
+            chunk = noise[:stop-start]
+            self.rng.standard_normal(dtype=self._error_dtype, out=chunk)
+            np.multiply(sigma[start:stop], chunk, out=drawn[start:stop])
+        return drawn
 
     @property
     def errors(self):
-        if self._error_keys.difference(self.galaxia_output.columns):
-            magnitudes = self.ananke.galaxia_catalogue_mag_names
-            with_columns = []
-            for prop_name, error in self._expand_and_apply_error_model(self.galaxia_output).items():
+        galaxia_output = self.galaxia_output
+        sigma_template, error_template = self._sigma_template, self._error_template
+        if not self.ignore and self._error_prop_names and self._first_error_key not in galaxia_output.column_names:
+            n_stars = galaxia_output.shape[0]
+            for prop_name, error in self._expand_and_apply_error_model(galaxia_output).items():
                 # pre-generate the keys to use for the standard error and its actual gaussian drawn error of property prop_name
-                prop_sig_name, prop_err_name = self._sigma_template(prop_name), self._error_template(prop_name)
+                prop_sig_name, prop_err_name = sigma_template(prop_name), error_template(prop_name)
                 # assign the column of the standard error values for property prop_name in the final catalogue output 
-                self.galaxia_output[prop_sig_name] = error
+                error = np.broadcast_to(utils.to_numpy(error), (n_stars,)).astype(self._error_dtype)
+                galaxia_output[prop_sig_name] = error
                 # assign the column of the actual gaussian drawn error values for property prop_name in the final catalogue output 
-                self.galaxia_output[prop_err_name] = error*np.random.randn(self.galaxia_output.shape[0])
+                # (materialized here so the random draws are never part of a lazily re-evaluated expression)
+                prop_err = self._draw_gaussian_errors(error, n_stars)
+                galaxia_output[prop_err_name] = prop_err
                 # add the drawn error value to the existing quantity for property prop_name
-                self.galaxia_output[prop_name] += self.galaxia_output[prop_err_name]
-                with_columns.append(prop_name)
-        self.galaxia_output.flush_extra_columns_to_hdf5(with_columns=tuple(with_columns))
-        self.galaxia_output._pp_convert_icrs_to_galactic()
-        return self.galaxia_output[list(self._error_keys)]
+                galaxia_output[prop_name] = galaxia_output[prop_name].to_numpy() + prop_err
+            galaxia_output.flush_extra_columns_to_hdf5(with_columns=self._error_prop_names)
+            galaxia_output._pp_convert_icrs_to_galactic()
+        # the error model may only return a subset of the magnitudes, and none are added when ignoring it
+        columns = set(galaxia_output.column_names)
+        return galaxia_output[[key for key in self._error_keys if key in columns]]
 
     @property
     def parameters(self):
         return self.__parameters
     
+    @property
+    def ignore(self):
+        return self.parameters.get('ignore', False)
+
+    @property
+    def seed(self):
+        return self.parameters.get('seed', None)
+
+    @property
+    def rng(self):
+        return self.__rng
+
     @property
     def error_model(self):  # TODO design
         return self.parameters.get('error_model', [getattr(iso, 'default_error_model', self.__missing_default_error_model_for_isochrone(iso)) for iso in self.ananke.galaxia_isochrones])
@@ -7,11 +7,15 @@ available in the main ``ananke`` namespace - use that instead.
 """
 from __future__ import annotations
 from typing import TYPE_CHECKING
+import os
+import tempfile
+import hashlib
+import pathlib
 from warnings import warn
+from functools import partial
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import scipy as sp
-import scipy.interpolate  # needed for python==3.7
 
 from . import utils
 from ._default_extinction_coeff import *
@@ -22,6 +26,8 @@ if TYPE_CHECKING:
 
 __all__ = ['ExtinctionDriver']
 
+_LN10 = np.log(10)
+
 
 class ExtinctionDriver:
     """
@@ -35,6 +41,13 @@ class ExtinctionDriver:
     _extinction_template = _extinction_formatter.format
     _extinction_0 = _extinction_template(0)
     _extra_output_keys = (_reddening, _extinction_0)
+    _interpolators = {'linear': 'LinearNDInterpolator',  # barycentric interpolation over a Delaunay triangulation
+                      'nearest': 'NearestNDInterpolator',  # nearest particle lookup through a KD-tree
+                      'grid': 'LinearNDInterpolator'}  # barycentric interpolation resampled on a regular grid
+    _default_interpolation = 'linear'
+    _default_grid_size = 128
+    _interpolation_chunk_size = 2**16  # minimum number of positions interpolated per thread
+    _extinction_dtype = np.float32  # precision of the column density, reddening and extinction columns
 
     def __init__(self, ananke: Ananke, **kwargs) -> None:
         """
@@ -62,32 +75,114 @@ class ExtinctionDriver:
                 photometric system to check if it has a default function to use.
                 If it doesn't find one it will simply fill extinction with nan
                 values.
+
+            interpolation : str
+                Scheme used to interpolate the particle column densities at the
+                positions of the mock stars, either 'linear' for a barycentric
+                interpolation over the Delaunay triangulation of the particles,
+                or 'nearest' for a much cheaper nearest particle lookup that
+                scales better to large numbers of particles, or 'grid' for a
+                trilinear interpolation over a regular grid on which the
+                barycentric interpolation is sampled once, which is cheaper
+                for large numbers of stars at the cost of resolution. Default
+                to '{INTERPOLATION}'.
+
+            grid_size : int
+                Number of nodes per dimension, at least 2, of the regular grid
+                used by the 'grid' interpolation scheme, which spans the
+                bounding box of the particles in the shell. Nodes outside the
+                convex hull of these particles are NaN, and so are the stars
+                in any grid cell touching one, hence slightly more NaN column
+                densities near the edges of the particles than with 'linear'.
+                Default to {GRID_SIZE}.
+
+            grid_cache_dir : str
+                Directory where the regular grid of the 'grid' interpolation
+                scheme is saved once sampled, and loaded from on later runs
+                with the same particles, observer, shell and grid size. Default
+                to None, which disables the cache.
         """
         self.__ananke = ananke
+        self.__ananke_particle_attributes = frozenset(attr for attr in dir(ananke) if attr.startswith('particle'))
         self.__interpolator = None
+        self.__extinction_keys = None
+        self.__first_extinction_key = None
         self.__parameters = kwargs
         self._test_extinction_coeff()
     
-    __init__.__doc__ = __init__.__doc__.format(Q_DUST=Q_DUST, TOTAL_TO_SELECTIVE=TOTAL_TO_SELECTIVE)
+    __init__.__doc__ = __init__.__doc__.format(Q_DUST=Q_DUST, TOTAL_TO_SELECTIVE=TOTAL_TO_SELECTIVE, INTERPOLATION=_default_interpolation, GRID_SIZE=_default_grid_size)
     
     def _make_interpolator(self):
+        # scipy.interpolate is only imported when extinctions are actually requested as it is slow to import
+        import scipy as sp
+        import scipy.interpolate  # needed for python==3.7
         # center particle coordinates on the observer
         xhel_p = self.ananke.particle_positions - self.ananke.observer_position[:3]
         # TODO coordinates.SkyCoord(**dict(zip([*'uvw'], xhel_p.T)), unit='kpc', representation_type='cartesian', frame='galactic') ?
-        # return distances from observer to particles
-        dhel_p = np.linalg.norm(xhel_p, axis=1)
-        # return the min,max extent of the shell of particles used by Galaxia (with a +-0.1 margin factor)
-        rmin, rmax = self.ananke.universe_rshell * [0.9, 1.1]
+        # squared distances from observer to particles, summing squares row-wise without an (N,3) temporary
+        d2hel_p = np.einsum('ij,ij->i', xhel_p, xhel_p)
+        # return the squared min,max extent of the shell of particles used by Galaxia (with a +-0.1 margin factor)
+        rmin2, rmax2 = (self.ananke.universe_rshell * [0.9, 1.1])**2
         # create a mask for the particles that are within the shell
-        sel_interp = (rmin<dhel_p) & (dhel_p<rmax)
+        sel_interp = rmin2 < d2hel_p
+        sel_interp &= d2hel_p < rmax2
         # get the array of column densities input by the user to each particle
-        lognh = self.column_densities
+        points, lognh = xhel_p[sel_interp], self.column_densities[sel_interp]
         # generate the interpolator to use to get the column densities at positions in and around the particles
-        self.__interpolator = sp.interpolate.LinearNDInterpolator(xhel_p[sel_interp],lognh[sel_interp],rescale=False)  # TODO investigate NaN outputs from interpolator
+        make_interpolator = partial(getattr(sp.interpolate, self._interpolators[self.interpolation]), points, lognh, rescale=False)  # TODO investigate NaN outputs from interpolator
+        if self.interpolation == 'grid':
+            # the grid spans the bounding box of the particles actually interpolated, not the whole shell
+            axes = tuple(np.linspace(low, high, self.grid_size) for low, high in zip(points.min(axis=0), points.max(axis=0)))
+            lognh_grid = self._load_or_sample_grid(make_interpolator, axes, points, lognh)
+            self.__interpolator = sp.interpolate.RegularGridInterpolator(axes, lognh_grid, method='linear', bounds_error=False, fill_value=np.nan)
+        else:
+            self.__interpolator = make_interpolator()
         return self.__interpolator
 
+    def _sample_grid(self, interpolator, axes):
+        # sample the interpolator on the regular grid of the given axes, one x slice at a time
+        x_axis, y_axis, z_axis = axes
+        slice_yz = np.stack(np.meshgrid(y_axis, z_axis, indexing='ij'), axis=-1).reshape(-1, 2)
+        slice_xyz = np.empty((slice_yz.shape[0], 3))
+        slice_xyz[:, 1:] = slice_yz
+        lognh_grid = np.empty((len(x_axis), len(y_axis), len(z_axis)))
+        for i, x in enumerate(x_axis):
+            slice_xyz[:, 0] = x
+            lognh_grid[i] = self._interpolate_column_densities(slice_xyz, interpolator).reshape(lognh_grid.shape[1:])
+        return lognh_grid
+
+    def _load_or_sample_grid(self, make_interpolator, axes, points, values):
+        if self.grid_cache_dir is None:
+            return self._sample_grid(make_interpolator(), axes)
+        # the grid is stored under a hash of everything it is sampled from, and memory-mapped when reused
+        digest = hashlib.blake2b(digest_size=16)
+        for array in (*axes, points, values):
+            digest.update(np.ascontiguousarray(array, dtype=np.float64).tobytes())
+        cache_file = pathlib.Path(self.grid_cache_dir) / f"{self._col_density}_grid_{digest.hexdigest()}.npy"
+        if cache_file.exists():
+            try:
+                lognh_grid = np.load(cache_file, mmap_mode='r')
+            except (OSError, ValueError):  # unreadable or truncated cache file, sampled again below
+                pass
+            else:
+                if lognh_grid.shape == tuple(map(len, axes)):
+                    return lognh_grid
+        lognh_grid = self._sample_grid(make_interpolator(), axes)
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file of the same directory first, so that an interrupted or concurrent run never leaves a partial grid under the final name
+        with tempfile.NamedTemporaryFile(dir=cache_file.parent, prefix=f".{cache_file.stem}_", suffix='.npy', delete=False) as temp_file:
+            temp_path = temp_file.name
+            try:
+                np.save(temp_file, lognh_grid)
+            except BaseException:
+                temp_file.close()
+                os.remove(temp_path)
+                raise
+        os.replace(temp_path, cache_file)
+        return lognh_grid
+
     def __getattr__(self, item):
-        if (item in self.ananke.__dir__() and item.startswith('particle')):
+        if item in self.__ananke_particle_attributes:
             return getattr(self.ananke, item)
         else:
             return self.__getattribute__(item)
@@ -98,7 +193,8 @@ class ExtinctionDriver:
 
     @property
     def column_densities(self):
-        return self.particles[self._col_density] if self._col_density in self.particles else np.nan*self.particle_masses
+        # the nan fallback is a read-only broadcast view, so that no array of the size of the particles is allocated
+        return self.particles[self._col_density] if self._col_density in self.particles else np.broadcast_to(np.nan, np.shape(self.particle_masses))
     
     @property
     def galaxia_output(self):
@@ -106,7 +202,12 @@ class ExtinctionDriver:
     
     @property
     def galaxia_pos(self):
-        return np.array(self.galaxia_output[self._galaxia_pos])
+        galaxia_output = self.galaxia_output
+        # fill the (N,3) array column by column, without going through an intermediate 3-columns dataframe
+        galaxia_pos = np.empty((galaxia_output.shape[0], len(self._galaxia_pos)), dtype=np.float64)
+        for i, pos in enumerate(self._galaxia_pos):
+            galaxia_pos[:, i] = galaxia_output[pos].to_numpy()
+        return galaxia_pos
     
     @property
     def column_density_interpolator(self):
@@ -115,42 +216,77 @@ class ExtinctionDriver:
         else:
             return self.__interpolator
 
+    def _interpolate_column_densities(self, positions, interpolator=None):
+        if interpolator is None:
+            interpolator = self.column_density_interpolator
+        if not (hasattr(interpolator, 'tri') and len(positions)):
+            return self._query_in_chunks(interpolator, positions)
+        # scipy's Delaunay point location walks from the simplex found for the previous point,
+        # querying the positions along a Z-order curve keeps consecutive walks short
+        order = utils.morton_order(positions)
+        interpolated = np.empty(len(positions))
+        interpolated[order] = self._query_in_chunks(interpolator, positions[order])
+        return interpolated
+
+    def _query_in_chunks(self, interpolator, positions):
+        n_chunks = min(os.cpu_count() or 1, len(positions) // self._interpolation_chunk_size)
+        if n_chunks <= 1:
+            return interpolator(positions)
+        # scipy evaluates the interpolators without holding the GIL, so chunks of positions can be queried concurrently
+        with ThreadPoolExecutor(max_workers=n_chunks) as executor:
+            return np.concatenate(list(executor.map(interpolator, np.array_split(positions, n_chunks))))
+
     @property
     def interpolated_column_densities(self):
         if self._interp_col_dens not in self.galaxia_output.column_names:
-            self.galaxia_output[self._interp_col_dens] = self.column_density_interpolator(self.galaxia_pos)
+            self.galaxia_output[self._interp_col_dens] = self._interpolate_column_densities(self.galaxia_pos).astype(self._extinction_dtype, copy=False)
         return self.galaxia_output[self._interp_col_dens]
     
+    def _make_reddening_and_extinction_0(self):
+        # E(B-V) = q_dust * 10**log10_NH computed as q_dust * exp(ln(10)*log10_NH) within a single buffer
+        reddening = np.multiply(utils.to_numpy(self.interpolated_column_densities), _LN10, dtype=self._extinction_dtype)
+        np.exp(reddening, out=reddening)
+        reddening *= self.q_dust
+        self.galaxia_output[self._reddening] = reddening
+        # A_0 = R_V * E(B-V)
+        self.galaxia_output[self._extinction_0] = self.total_to_selective * reddening
+
     @property
     def reddening(self):
         if self._reddening not in self.galaxia_output.column_names:
-            self.galaxia_output[self._reddening] = self.q_dust * 10**self.interpolated_column_densities
+            self._make_reddening_and_extinction_0()
         return self.galaxia_output[self._reddening]
 
     @property
     def extinction_0(self):
         if self._extinction_0 not in self.galaxia_output.column_names:
-            self.galaxia_output[self._extinction_0] = self.total_to_selective * self.reddening
+            if self._reddening not in self.galaxia_output.column_names:
+                self._make_reddening_and_extinction_0()
+            else:
+                self.galaxia_output[self._extinction_0] = self.total_to_selective * self.reddening
         return self.galaxia_output[self._extinction_0]
 
     def _expand_and_apply_extinction_coeff(self, df, A0):
         extinction_coeff = self.extinction_coeff
         if not isinstance(extinction_coeff, Iterable):
             extinction_coeff = [extinction_coeff]
-        return {
-            key: (coeff * A0.to_numpy()
-                   if isinstance(coeff, np.ndarray)
-                   else coeff * A0)  # TODO temporary fix while waiting issue https://github.com/vaexio/vaex/issues/2405 to be fixed
-            for coeff_dict in [
-                (ext_coeff(df) if callable(ext_coeff) else ext_coeff)
-                for ext_coeff in extinction_coeff
-                ]
-            for key,coeff in coeff_dict.items()
-            }  # TODO adapt to dataframe type of output?
+        A0_array = None
+        extinctions = {}
+        for ext_coeff in extinction_coeff:
+            for key, coeff in (ext_coeff(df) if callable(ext_coeff) else ext_coeff).items():  # TODO adapt to dataframe type of output?
+                if isinstance(coeff, np.ndarray):  # TODO temporary fix while waiting issue https://github.com/vaexio/vaex/issues/2405 to be fixed
+                    if A0_array is None:
+                        A0_array = A0.to_numpy()
+                    extinctions[key] = np.multiply(coeff, A0_array, dtype=self._extinction_dtype)
+                elif np.isscalar(coeff) and coeff == 0:
+                    extinctions[key] = 0.  # identically zero extinction, left as a scalar for the caller to skip
+                else:
+                    extinctions[key] = coeff * A0
+        return extinctions
 
     def _test_extinction_coeff(self):
-        dummy_df = utils.RecordingDataFrame([], columns = self.ananke.galaxia_catalogue_keys + self._extra_output_keys)  # TODO make use of dummy_df.record_of_all_used_keys
-        dummy_df.loc[0] = np.nan
+        columns = self.ananke.galaxia_catalogue_keys + self._extra_output_keys
+        dummy_df = utils.RecordingDataFrame(np.full((1, len(columns)), np.nan), columns=columns)  # TODO make use of dummy_df.record_of_all_used_keys
         try:
             dummy_ext = self._expand_and_apply_extinction_coeff(dummy_df, dummy_df[self._extinction_0])
         except KeyError as KE:
@@ -159,18 +295,35 @@ class ExtinctionDriver:
     
     @property
     def _extinction_keys(self):
-        return set(map(self._extinction_template, self.ananke.galaxia_catalogue_mag_names))
+        if self.__extinction_keys is None:
+            self.__extinction_keys = frozenset(map(self._extinction_template, self.ananke.galaxia_catalogue_mag_names))
+        return self.__extinction_keys
+
+    @property
+    def _first_extinction_key(self):
+        # extinction columns are all added in the same pass, checking the first one is enough to tell if they were added
+        if self.__first_extinction_key is None:
+            self.__first_extinction_key = self._extinction_template(self.ananke.galaxia_catalogue_mag_names[0])
+        return self.__first_extinction_key
 
     @property
     def extinctions(self):
-        if self._extinction_keys.difference(self.galaxia_output.columns):
-            for mag_name, extinction in self._expand_and_apply_extinction_coeff(self.galaxia_output, self.extinction_0).items():
+        galaxia_output = self.galaxia_output
+        extinction_template = self._extinction_template
+        if self._first_extinction_key not in galaxia_output.column_names:
+            A0 = self.extinction_0
+            for mag_name, extinction in self._expand_and_apply_extinction_coeff(galaxia_output, A0).items():
+                ext_name = extinction_template(mag_name)
+                if np.isscalar(extinction) and extinction == 0:
+                    # identically zero extinction for filter mag_name, the magnitude is left untouched even where A_0 is nan
+                    galaxia_output[ext_name] = np.zeros(galaxia_output.shape[0], dtype=self._extinction_dtype)
+                    continue
                 # assign the column of the extinction values for filter mag_name in the final catalogue output 
-                self.galaxia_output[self._extinction_template(mag_name)] = extinction
+                galaxia_output[ext_name] = extinction
                 # add the extinction value to the existing photometric magnitude for filter mag_name
-                self.galaxia_output[mag_name] += self.galaxia_output[self._extinction_template(mag_name)]
-        self.galaxia_output.flush_extra_columns_to_hdf5(with_columns=self.ananke.galaxia_catalogue_mag_names)
-        return self.galaxia_output[list(self._extinction_keys)]
+                galaxia_output[mag_name] += galaxia_output[ext_name]
+            galaxia_output.flush_extra_columns_to_hdf5(with_columns=self.ananke.galaxia_catalogue_mag_names)
+        return galaxia_output[list(self._extinction_keys)]
 
     @property
     def parameters(self):
@@ -184,6 +337,24 @@ class ExtinctionDriver:
     def total_to_selective(self):
         return self.parameters.get('total_to_selective', TOTAL_TO_SELECTIVE)
     
+    @property
+    def interpolation(self):
+        interpolation = self.parameters.get('interpolation', self._default_interpolation)
+        if interpolation not in self._interpolators:
+            raise ValueError(f"Interpolation scheme should be one of {list(self._interpolators)}, got '{interpolation}'")
+        return interpolation
+
+    @property
+    def grid_size(self):
+        grid_size = self.parameters.get('grid_size', self._default_grid_size)
+        if grid_size < 2:
+            raise ValueError(f"Grid size should be at least 2, got {grid_size}")
+        return grid_size
+
+    @property
+    def grid_cache_dir(self):
+        return self.parameters.get('grid_cache_dir', None)
+
     @property
     def extinction_coeff(self):
         return self.parameters.get('extinction_coeff', [getattr(iso, 'default_extinction_coeff', self.__missing_default_extinction_coeff_for_isochrone(iso)) for iso in self.ananke.galaxia_isochrones])
@@ -192,5 +363,5 @@ class ExtinctionDriver:
     def __missing_default_extinction_coeff_for_isochrone(isochrone):
         def __return_nan_coeff_and_warn(df):
             warn(f"Method default_extinction_coeff isn't defined for isochrone {isochrone.key}", UserWarning, stacklevel=2)
-            return {mag: np.zeros(df.shape[0])*0. for mag in isochrone.to_export_keys}
+            return {mag: 0. for mag in isochrone.to_export_keys}  # scalar coefficients broadcast against A_0 without per-star arrays
         return __return_nan_coeff_and_warn
@@ -48,9 +48,8 @@ class Observer:  # TODO SkyCoord for center point: SkyCoord(u=-rSun[0], v=-rSun[
         self.__parameters = kwargs
     
     def __prepare_position(self, pos: np.typing.ArrayLike):
-        pos = np.array(pos)
-        pos[np.isnan(pos)] = self._default_position[np.isnan(pos)]
-        return pos
+        pos = np.asarray(pos, dtype=float)
+        return np.where(np.isnan(pos), self._default_position, pos)
 
     @property
     def ananke(self):
@@ -26,7 +26,7 @@ class Universe:
     _rmin = 'r_min'
     _rmax = 'r_max'
     _rshell = [_rmin,_rmax]
-    _default_rshell = np.array([DEFAULTS_FOR_PARFILE[_p] for _p in _rshell])
+    _default_rshell = np.array([DEFAULTS_FOR_PARFILE[_p] for _p in _rshell], dtype=float)
 
     def __init__(self, ananke: Ananke, rshell: np.typing.ArrayLike, **kwargs) -> None:
         """
@@ -45,9 +45,8 @@ class Universe:
         self.__parameters = kwargs
     
     def __prepare_rshell(self, rshell: np.typing.ArrayLike):
-        rshell = np.array(rshell)
-        rshell[np.isnan(rshell)] = self._default_rshell[np.isnan(rshell)]
-        return rshell
+        rshell = np.asarray(rshell, dtype=float)
+        return np.where(np.isnan(rshell), self._default_rshell, rshell)
 
     @property
     def ananke(self):
@@ -9,6 +9,33 @@ import numpy as np
 from astropy import units
 from Galaxia_ananke import photometry as ph
 
+_MAS_TO_DEG = (units.mas/units.deg).si.scale
+# c[0] + c[1]*exp(prop/c[2]) coefficients of the Gaia DR2 error models
+_GAIADR2_COEFFS = {'gmag'    : [0.000214143, 1.07523e-7, 1.75147],
+                   'bprpmag' : [0.00162729, 2.52848e-8, 1.25981],
+                   'pospar'  : [0.0426028, 2.583e-10, 0.923162],
+                   'pm'      : [0.0861852, 6.0771e-9, 1.05067],
+                   'rv'      : [0.278939, 0.0000355589, 1.10179]
+}
+
+def _grvs_from_g_rp(gmag, rpmag):
+    # from equations 2 and 3 of DR2 release paper
+    ggrp = gmag - rpmag
+    poly_hi = (((34.026*ggrp - 190.97)*ggrp + 402.32)*ggrp - 377.28)*ggrp + 132.32
+    poly_lo = (((0.53768*ggrp - 1.3947)*ggrp + 1.0215)*ggrp - 0.65124)*ggrp + 0.042319
+    return rpmag + np.where(ggrp < 1.4, poly_lo, poly_hi)
+
+def _gaiadr2_model(prop, errtype):
+    c = _GAIADR2_COEFFS[errtype]
+    return c[0] + c[1]*np.exp(prop/c[2])
+
+_GAIADR2_GMAG_COEFFS = np.array([_GAIADR2_COEFFS[_errtype] for _errtype in ['gmag', 'bprpmag', 'pospar', 'pm']])
+
+def _gaiadr2_models_of_gmag(gmag):
+    # all G magnitude driven models at once, shape (4, len(gmag))
+    c = _GAIADR2_GMAG_COEFFS
+    return c[:,0,None] + c[:,1,None]*np.exp(gmag[None,:]/c[:,2,None])
+
 def _temp(df):
     """
     Default error model function for the Gaia DR2 photometric system.
@@ -30,40 +57,22 @@ def _temp(df):
     PMDEC = 'mudec'
     VR    = 'vr'
     TEFF  = 'teff'
-    MAS_TO_DEG = (units.mas/units.deg).si.scale
-    def grvs_from_g_rp(gmag, rpmag):
-        # from equations 2 and 3 of DR2 release paper
-        ggrp = gmag - rpmag
-        grvs = rpmag + 132.32 - 377.28*ggrp + 402.32*ggrp**2 - 190.97*ggrp**3 + 34.026*ggrp**4
-        mask = ggrp < 1.4
-        grvs[mask] = rpmag[mask] + 0.042319 - 0.65124*ggrp[mask] + 1.0215*ggrp[mask]**2 - 1.3947*ggrp[mask]**3 + 0.53768*ggrp[mask]**4
-        return grvs    
-    def _model(prop, errtype):
-        coeffs = {'gmag'    : [0.000214143, 1.07523e-7, 1.75147],
-                  'bprpmag' : [0.00162729, 2.52848e-8, 1.25981],
-                  'pospar'  : [0.0426028, 2.583e-10, 0.923162],
-                  'pm'      : [0.0861852, 6.0771e-9, 1.05067],
-                  'rv'      : [0.278939, 0.0000355589, 1.10179]
-        }
-        c=coeffs[errtype]
-        return c[0] + c[1]*np.exp(prop/c[2])
     gmag  = df[GMAG].to_numpy()
     rpmag = df[RPMAG].to_numpy()
     teff  = df[TEFF].to_numpy()
-    errors = {k: np.zeros_like(gmag)*np.nan for k in [GMAG, RPMAG, BPMAG, PI, RA, DEC, PMRA, PMDEC, VR]}
+    errors = {k: np.full(gmag.shape, np.nan) for k in [GMAG, RPMAG, BPMAG, PI, RA, DEC, PMRA, PMDEC, VR]}
     ################################
-    maglims = (gmag>3.0) & (gmag<21.0)
-    errors[GMAG][maglims] = _model(gmag[maglims], 'gmag')
-    errors[RPMAG][maglims] = errors[BPMAG][maglims] = _model(gmag[maglims], 'bprpmag')
-    errors[PI][maglims] = errors[RA][maglims] = errors[DEC][maglims] = _model(gmag[maglims], 'pospar')  # astrometrics (in mas)
-    errors[PMRA][maglims] = errors[PMDEC][maglims] = _model(gmag[maglims], 'pm')  # proper motions (in mas/yr)
-    errors[RA][maglims] *= MAS_TO_DEG
-    errors[DEC][maglims] *= MAS_TO_DEG
+    maglims = np.flatnonzero((gmag>3.0) & (gmag<21.0))  # packed indices are cheaper to reuse than a boolean mask
+    gmag_err, bprpmag_err, pospar_err, pm_err = _gaiadr2_models_of_gmag(gmag[maglims])
+    errors[GMAG][maglims] = gmag_err
+    errors[RPMAG][maglims] = errors[BPMAG][maglims] = bprpmag_err
+    errors[PI][maglims] = pospar_err  # astrometrics (in mas)
+    errors[RA][maglims] = errors[DEC][maglims] = pospar_err*_MAS_TO_DEG
+    errors[PMRA][maglims] = errors[PMDEC][maglims] = pm_err  # proper motions (in mas/yr)
     ################################
-    grvs = grvs_from_g_rp(gmag, rpmag)
-    maglims = (grvs<14) & (3550<=teff) & (teff<=6900)
-    errors[VR][maglims] = _model(grvs[maglims], 'rv')
-    errors[VR][maglims] = np.sqrt(errors[VR][maglims]**2 + 0.11**2) #systematic floor
+    grvs = _grvs_from_g_rp(gmag, rpmag)
+    maglims = np.flatnonzero((grvs<14) & (3550<=teff) & (teff<=6900))
+    errors[VR][maglims] = np.hypot(_gaiadr2_model(grvs[maglims], 'rv'), 0.11) #systematic floor
     return errors
 
 ph.available_photo_systems['padova/GAIADR2'].default_error_model = _temp
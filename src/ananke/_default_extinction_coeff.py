@@ -26,7 +26,12 @@ def _temp(df):
     }
     bp_rp_int = df['gaiadr2_g_bpmag'] - df['gaiadr2_g_rpmag']
     A_0 = df['A_0']
+    # Terms shared by all bands, built once as expressions so that the coefficients stay lazy
+    bp_rp_int_2 = bp_rp_int*bp_rp_int
+    bp_rp_int_3 = bp_rp_int_2*bp_rp_int
+    A_0_2 = A_0*A_0
+    bp_rp_int_A_0 = bp_rp_int*A_0
     # Coeffients from Equation 1 of Babusiaux et al. 2018
-    return {b: c[1] + c[2]*bp_rp_int + c[3]*bp_rp_int**2 + c[4]*bp_rp_int**3 +c[5]*A_0 +c[6]*A_0**2 +c[7]*bp_rp_int*A_0 for b,c in consts.items()}
+    return {b: c[1] + c[2]*bp_rp_int + c[3]*bp_rp_int_2 + c[4]*bp_rp_int_3 +c[5]*A_0 +c[6]*A_0_2 +c[7]*bp_rp_int_A_0 for b,c in consts.items()}
 
 ph.available_photo_systems['padova/GAIADR2'].default_extinction_coeff = _temp
@@ -2,11 +2,12 @@
 """
 Module miscellaneous utilities
 """
+import numpy as np
 import pandas as pd
 
 from Galaxia_ananke import utils as Gutils
 
-__all__ = ['compare_given_and_required', 'confirm_equal_length_arrays_in_dict', 'RecordingDataFrame']
+__all__ = ['compare_given_and_required', 'confirm_equal_length_arrays_in_dict', 'to_numpy', 'morton_order', 'RecordingDataFrame']
 
 
 compare_given_and_required = Gutils.compare_given_and_required
@@ -14,6 +15,30 @@ compare_given_and_required = Gutils.compare_given_and_required
 confirm_equal_length_arrays_in_dict = Gutils.confirm_equal_length_arrays_in_dict
 
 
+def to_numpy(array):
+    """
+    Materialize a vaex expression, pandas series or array-like as a numpy array
+    """
+    return array.to_numpy() if hasattr(array, 'to_numpy') else np.asarray(array)
+
+
+def morton_order(positions, bits=10):
+    """
+    Return the permutation that sorts the given (N,D) positions along a
+    Z-order (Morton) space-filling curve with 2**bits cells per dimension
+    """
+    positions = np.asarray(positions)
+    ndim = positions.shape[1]
+    lo, hi = positions.min(axis=0), positions.max(axis=0)
+    cells = ((positions - lo) / np.where(hi > lo, hi - lo, 1) * (2**bits - 1)).astype(np.uint64)
+    codes = np.zeros(positions.shape[0], dtype=np.uint64)
+    one = np.uint64(1)
+    for bit in range(bits):
+        for dim in range(ndim):
+            codes |= ((cells[:, dim] >> np.uint64(bit)) & one) << np.uint64(bit*ndim + dim)
+    return np.argsort(codes, kind='stable')
+
+
 class RecordingDataFrame(pd.DataFrame):
     """
     Pandas DataFrame that records all its used keys from getitem